@@ -1,13 +1,31 @@
-from datetime import date
-import holidays
+from datetime import date, datetime
+import contextlib
+import csv
+import functools
 import os
-import pandas as pd
+import shutil
 import argparse
 import sys
+import tempfile
 from pathlib import Path
 import calendar
 import tomllib
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, TextIO, Tuple
+
+# Columns of newly created monthly CSV files. Existing files keep the columns they have.
+COLUMNS: Tuple[str, ...] = (
+    'Date',
+    'Is Holiday',
+    'Start Time',
+    'End Time',
+    'Break Time',
+    'Vacation',
+    'Sick Leave',
+    'Notes',
+)
+
+# Default config path relative to main.py location
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / 'config.toml'
 
 
 def load_config(config_path: Path) -> Dict[str, Any]:
@@ -35,23 +53,25 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     return loaded_config
 
 
-def dummy_df() -> pd.DataFrame:
+def holiday_settings(config: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get the holiday arguments for create_csv from the configuration.
+
+    :param config: Configuration dictionary
+    :return: Dict with country and subdiv
     """
-    Define columns and their data types
-    :return: Empty DataFrame with specified columns and dtypes
+    return {'country': config['holidays']['country'], 'subdiv': config['holidays']['subdivision']}
+
+
+def display_settings(config: Dict[str, Any]) -> Dict[str, str]:
     """
-    column_spec = {
-        'Date': 'str',
-        'Is Holiday': 'str',
-        'Start Time': 'str',
-        'End Time': 'str',
-        'Break Time': 'str',
-        'Vacation': 'str',
-        'Sick Leave': 'str',
-        'Notes': 'str'
-    }
+    Get the display arguments for show_csv from the configuration.
 
-    return pd.DataFrame(columns=list(column_spec.keys())).astype(column_spec)
+    :param config: Configuration dictionary
+    :return: Dict with nan_replacement and table_format
+    """
+    return {'nan_replacement': config['display']['nan_replacement'],
+            'table_format': config['display']['table_format']}
 
 
 def get_filename(date_arg: date, path: Path) -> Path:
@@ -65,103 +85,200 @@ def get_filename(date_arg: date, path: Path) -> Path:
     return Path(path) / f'schedule_{date_arg.year}-{date_arg.month:02d}.csv'
 
 
-def create_csv(date_arg: date, _: None, path: Path):
+@functools.cache
+def get_config(config_path: Path) -> Dict[str, Any]:
+    """
+    Load the configuration via load_config, parsing each config file only once per process.
+
+    :param config_path: Path to config.toml file
+    :return: Configuration dictionary
+    """
+    return load_config(config_path)
+
+
+@contextlib.contextmanager
+def open_atomic(filename: Path, overwrite: bool = True) -> Iterator[TextIO]:
+    """
+    Open a temporary file next to filename for writing and move it to filename once writing succeeded.
+    If writing fails, filename is left untouched and the temporary file is removed.
+
+    :param filename: Path to the file to write
+    :param overwrite: Whether to replace an existing filename. If False, FileExistsError is raised instead.
+    :return: File object of the temporary file
+    """
+    # A unique name, so concurrent writers of the same month never share a temporary file
+    f = tempfile.NamedTemporaryFile('w', newline='', dir=filename.parent, prefix=f'{filename.name}.',
+                                    suffix='.tmp', delete=False)
+    tmp_filename = Path(f.name)
+    try:
+        # The temporary file is private to the user, give it the permissions a plain open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_filename, 0o666 & ~umask)
+        with f:
+            yield f
+        if overwrite:
+            os.replace(tmp_filename, filename)
+        else:
+            try:
+                # Unlike os.replace, creating a hard link fails if filename already exists
+                os.link(tmp_filename, filename)
+            except FileExistsError:
+                raise
+            except OSError:
+                # No hard links on this file system (e.g. FAT or some network shares), copy instead
+                copy_exclusive(tmp_filename, filename)
+    finally:
+        f.close()
+        tmp_filename.unlink(missing_ok=True)
+
+
+def copy_exclusive(source: Path, filename: Path):
+    """
+    Copy source to filename, which must not exist yet. A partial copy is removed again.
+
+    :param source: Path to the file to copy
+    :param filename: Path to the new file
+    :raises FileExistsError: If filename already exists
+    """
+    with open(source, 'rb') as src:
+        dst = open(filename, 'xb')
+        try:
+            with dst:
+                shutil.copyfileobj(src, dst)
+        except BaseException:
+            filename.unlink(missing_ok=True)
+            raise
+
+
+@functools.lru_cache(maxsize=32)
+def get_holidays(country: str, subdiv: str, year: int):
+    """
+    Get the holidays for a region and year. Results are cached since building them is expensive.
+
+    :param country: Country code (ISO 3166-1 alpha-2)
+    :param subdiv: Subdivision code within the country
+    :param year: Year for which to compute the holidays
+    :return: holidays.HolidayBase mapping dates to holiday names
+    """
+    import holidays
+
+    return holidays.country_holidays(country, subdiv=subdiv, years=year)
+
+
+def create_csv(date_arg: date, _: None, filename: Path, country: str, subdiv: str):
     """
-    Create a CSV file with the columns specified in dummy_df.
-    The name of the file will be schedule_YYYY-MM.csv.
+    Create a CSV file with the columns specified in COLUMNS.
+    The name of the file is expected to come from get_filename, i.e. schedule_YYYY-MM.csv.
     
     :param date_arg: Date object representing the month and year for which to create the schedule
     :param _: Dummy parameter to match function signature
-    :param path: Path to the directory where the CSV file will be saved
+    :param filename: Path to the CSV file
+    :param country: Country code for holidays (ISO 3166-1 alpha-2)
+    :param subdiv: Subdivision code for holidays
     :return:
     """""
-
-    holidays_here = holidays.country_holidays(config['holidays']['country'], subdiv=config['holidays']['subdivision'],
-                                              years=date_arg.year)
-    # Create path if it doesn't exist
-    path.mkdir(parents=True, exist_ok=True)
-    # Assuming the year is the current year
-    filename = get_filename(date_arg, path)
-
-    # Check if file already exists
-    if os.path.exists(filename):
-        raise FileExistsError(f"The file '{filename}' already exists!")
+    holidays_here = get_holidays(country, subdiv, date_arg.year)
+    # Create the directory if it doesn't exist
+    filename.parent.mkdir(parents=True, exist_ok=True)
 
     # Get the number of days in the month
-    _, num_days = calendar.monthrange(date_arg.year, date_arg.month)
+    year, month = date_arg.year, date_arg.month
+    _, num_days = calendar.monthrange(year, month)
 
-    # Build all rows at once (more efficient than repeated concat)
-    rows = []
-    for day in range(1, num_days + 1):
-        current_date = date(date_arg.year, date_arg.month, day)
-        rows.append({
-            'Date': current_date.strftime('%Y-%m-%d'),
-            'Is Holiday': str(current_date in holidays_here),
-            'Notes': holidays_here.get(current_date, '')
-        })
+    # Plain dict of the holidays so lookups in the loop bypass the holidays library
+    holiday_map = dict(holidays_here)
+    # Year and month are the same for every row, only the day changes
+    date_prefix = f'{year:04d}-{month:02d}-'
 
-    df = pd.DataFrame(rows, columns=dummy_df().columns)
-    df.to_csv(filename, index=False)
+    # The file only appears once it is complete, and an existing file is never overwritten
+    try:
+        with open_atomic(filename, overwrite=False) as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(COLUMNS)
+            for day in range(1, num_days + 1):
+                current_date = date(year, month, day)
+                # Values in the order of COLUMNS
+                writer.writerow((
+                    f'{date_prefix}{day:02d}',
+                    str(current_date in holiday_map),
+                    '', '', '', '', '',
+                    holiday_map.get(current_date, ''),
+                ))
+    except FileExistsError:
+        raise FileExistsError(f"The file '{filename}' already exists!")
 
 
-def update_field(date_arg: date, column: str, value: Any, filename: Path):
+def update_fields(date_arg: date, updates: Dict[str, Any], filename: Path) -> List[Dict[str, str]]:
     """
-    Update a specific field in the CSV file for a given date.
+    Update several fields in the CSV file for a given date, reading and writing the file only once.
     :param date_arg: Date object
-    :param column: Column name to update
-    :param value: New value to set
+    :param updates: Dict mapping column names to their new values
     :param filename: Path to the CSV file
-    :return:
+    :return: Rows of the updated CSV file
+    :raises FileNotFoundError: If the CSV file does not exist yet, see create_csv
     """
-
-    if not os.path.exists(filename):
-        path = Path(os.path.dirname(filename))
-        create_csv(date_arg, None, path=path)
-
-    # parse the CSV file with types from dummy_df
-    df_month = pd.read_csv(filename, dtype=dummy_df().dtypes.to_dict(), skipinitialspace=True)
-    # Update the start time for the given date
-    df_month.loc[df_month['Date'] == date_arg.strftime('%Y-%m-%d'), column] = value
-    df_month.to_csv(filename, index=False)
-
-
-def log_start_time(date_arg: date, start_time: str, path: Path):
+    # Same as strftime('%Y-%m-%d') but without parsing a format string
+    date_str = date_arg.isoformat()
+    with open(filename, newline='') as f:
+        reader = csv.DictReader(f, skipinitialspace=True)
+        rows = list(reader)
+    # Keep the columns of the file, including ones added by the user, and add missing ones being set
+    fieldnames = list(reader.fieldnames or [])
+    new_columns = [column for column in updates if column not in fieldnames]
+    fieldnames += new_columns
+    for month_row in rows:
+        month_row.update(dict.fromkeys(new_columns, ''))
+
+    # Files have exactly one row per day in order, so the row index follows from the day
+    if len(rows) < date_arg.day:
+        raise ValueError(f"Expected row for {date_str} in '{filename}' but the file only has {len(rows)} rows")
+    row = rows[date_arg.day - 1]
+    if row['Date'] != date_str:
+        raise ValueError(f"Expected row for {date_str} in '{filename}' but found '{row['Date']}'")
+    for column, value in updates.items():
+        row[column] = str(value)
+
+    with open_atomic(filename) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator=os.linesep)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return rows
+
+
+def update_field(date_arg: date, column: str, value: Any, filename: Path) -> List[Dict[str, str]]:
     """
-    Log the start time for a given date in the CSV file.
+    Update a specific field in the CSV file for a given date.
     :param date_arg: Date object
-    :param start_time: Start time as a string
-    :param path: Path to the directory containing the CSV file
-    :return:
+    :param column: Column name to update
+    :param value: New value to set
+    :param filename: Path to the CSV file
+    :return: Rows of the updated CSV file
     """
-    try:
-        time = pd.to_datetime(start_time, format='%H:%M')
-    except ValueError:
-        raise ValueError(f"Invalid time format '{start_time}'. Expected HH:MM format (e.g., 09:00)")
-    update_field(date_arg, 'Start Time', time.strftime('%H:%M'), get_filename(date_arg, path))
+    return update_fields(date_arg, {column: value}, filename)
 
 
-def log_end_time(date_arg: date, end_time: str, path: Path):
+def format_time(time_str: str, example: str) -> str:
     """
-    Log the end time for a given date in the CSV file.
-    :param date_arg: Date object
-    :param end_time: End time as a string
-    :param path: Path to the directory containing the CSV file
-    :return:
+    Validate a time string and normalize it to HH:MM.
+    :param time_str: Time as a string in H:MM or HH:MM format
+    :param example: Example time for the error message
+    :return: Time as a string in HH:MM format
+    :raises ValueError: If time_str is not a valid time
     """
     try:
-        time = pd.to_datetime(end_time, format='%H:%M')
+        return datetime.strptime(time_str, '%H:%M').strftime('%H:%M')
     except ValueError:
-        raise ValueError(f"Invalid time format '{end_time}'. Expected HH:MM format (e.g., 17:00)")
-    update_field(date_arg, 'End Time', time.strftime('%H:%M'), get_filename(date_arg, path))
+        raise ValueError(f"Invalid time format '{time_str}'. Expected HH:MM format (e.g., {example})")
 
 
-def log_break_time(date_arg: date, break_time: str, path: Path):
+def format_break_time(break_time: str) -> str:
     """
-    Log the break time for a given date in the CSV file.
-    :param date_arg: Date object
+    Validate a break time and normalize it to HH:MM.
     :param break_time: Break time as an integer (minutes) or string in %H:%M format
-    :param path: Path to the directory containing the CSV file
-    :return:
+    :return: Break time as a string in HH:MM format
+    :raises ValueError: If break_time is negative or not a valid break time
     """
     try:
         # Check if break_time is a string that can be parsed as an integer (minutes)
@@ -172,83 +289,197 @@ def log_break_time(date_arg: date, break_time: str, path: Path):
                 raise ValueError("Break time cannot be negative")
             hours = break_time_int // 60
             minutes = break_time_int % 60
-            formatted_time = f'{hours:02d}:{minutes:02d}'
+            return f'{hours:02d}:{minutes:02d}'
         else:
             # Parse as time string in H:MM or HH:MM format
-            time = pd.to_datetime(break_time, format='%H:%M')
-            formatted_time = time.strftime('%H:%M')
+            return format_time(break_time, '01:00')
     except ValueError as e:
         if "cannot be negative" in str(e):
             raise
         raise ValueError(
             f"Invalid break time format '{break_time}'. Expected minutes (e.g., 60) or HH:MM format (e.g., 01:00)")
 
-    update_field(date_arg, 'Break Time', formatted_time, get_filename(date_arg, path))
+
+def log_start_time(date_arg: date, start_time: str, filename: Path) -> List[Dict[str, str]]:
+    """
+    Log the start time for a given date in the CSV file.
+    :param date_arg: Date object
+    :param start_time: Start time as a string
+    :param filename: Path to the CSV file
+    :return: Rows of the updated CSV file
+    """
+    formatted_time = format_time(start_time, '09:00')
+    return update_field(date_arg, 'Start Time', formatted_time, filename)
+
+
+def log_end_time(date_arg: date, end_time: str, filename: Path) -> List[Dict[str, str]]:
+    """
+    Log the end time for a given date in the CSV file.
+    :param date_arg: Date object
+    :param end_time: End time as a string
+    :param filename: Path to the CSV file
+    :return: Rows of the updated CSV file
+    """
+    formatted_time = format_time(end_time, '17:00')
+    return update_field(date_arg, 'End Time', formatted_time, filename)
+
+
+def log_break_time(date_arg: date, break_time: str, filename: Path) -> List[Dict[str, str]]:
+    """
+    Log the break time for a given date in the CSV file.
+    :param date_arg: Date object
+    :param break_time: Break time as an integer (minutes) or string in %H:%M format
+    :param filename: Path to the CSV file
+    :return: Rows of the updated CSV file
+    """
+    formatted_time = format_break_time(break_time)
+    return update_field(date_arg, 'Break Time', formatted_time, filename)
 
 
-def log_vacation(date_arg: date, vacation: float, path: Path):
+def log_times(date_arg: date, times: Dict[str, str], filename: Path) -> List[Dict[str, str]]:
+    """
+    Log start, end and/or break time for a given date with a single update of the CSV file.
+    :param date_arg: Date object
+    :param times: Dict mapping 'start', 'end' and/or 'break' to the time as a string
+    :param filename: Path to the CSV file
+    :return: Rows of the updated CSV file
+    """
+    updates = {}
+    if 'start' in times:
+        updates['Start Time'] = format_time(times['start'], '09:00')
+    if 'end' in times:
+        updates['End Time'] = format_time(times['end'], '17:00')
+    if 'break' in times:
+        updates['Break Time'] = format_break_time(times['break'])
+    if not updates:
+        raise ValueError("Nothing to log. Provide at least one of --start, --end or --break.")
+    return update_fields(date_arg, updates, filename)
+
+
+def log_vacation(date_arg: date, vacation: float, filename: Path) -> List[Dict[str, str]]:
     """
     Log vacation for a given date in the CSV file.
     :param date_arg: Date object
     :param vacation: float representing full or half day vacation (1.0 or 0.5)
-    :param path: Path to the directory containing the CSV file
-    :return:
+    :param filename: Path to the CSV file
+    :return: Rows of the updated CSV file
     """
     # Ensure vacation is either 1.0 or 0.5
     if vacation not in [0.5, 1.0]:
         raise ValueError("Vacation must be either 0.5 (half day) or 1.0 (full day).")
-    update_field(date_arg, 'Vacation', vacation, get_filename(date_arg, path))
+    return update_field(date_arg, 'Vacation', vacation, filename)
 
 
-def log_sick_leave(date_arg: date, sick_leave: float, path: Path):
+def log_sick_leave(date_arg: date, sick_leave: float, filename: Path) -> List[Dict[str, str]]:
     """
     Log sick leave for a given date in the CSV file.
     :param date_arg: Date object
     :param sick_leave: float representing full or half day sick leave (1.0 or 0.5)
-    :param path: Path to the directory containing the CSV file
-    :return:
+    :param filename: Path to the CSV file
+    :return: Rows of the updated CSV file
     """
     # Ensure sick_leave is either 1.0 or 0.5
     if sick_leave not in [0.5, 1.0]:
         raise ValueError("Sick leave must be either 0.5 (half day) or 1.0 (full day).")
-    update_field(date_arg, 'Sick Leave', sick_leave, get_filename(date_arg, path))
+    return update_field(date_arg, 'Sick Leave', sick_leave, filename)
 
 
-def show_csv(date_arg: date, days: int, path: Path):
+def show_csv(date_arg: date, days: int, filename: Path, nan_replacement: str, table_format: str,
+             rows: Optional[List[Dict[str, str]]] = None):
     """
     Print the contents of the CSV file for the given month.
     :param date_arg: Date object
-    :param path: Path to the directory containing the CSV file
+    :param filename: Path to the CSV file
     :param days: Number of days to show (shows 'days' entries ending at base_day)
+    :param nan_replacement: String to show for empty fields
+    :param table_format: Table format passed to tabulate
+    :param rows: Already loaded rows of the CSV file. If None, the file is read.
     :return:
     """
-    filename = get_filename(date_arg, path)
+    from tabulate import tabulate
 
-    # Configure pandas display options to show all columns
-    pd.set_option('display.max_columns', None)
-    pd.set_option('display.width', None)
-    pd.set_option('display.max_colwidth', None)
+    if rows is None:
+        with open(filename, newline='') as f:
+            rows = list(csv.DictReader(f, skipinitialspace=True))
 
-    df_month = pd.read_csv(filename, dtype=dummy_df().dtypes.to_dict(), skipinitialspace=True).fillna(
-        config['display']['nan_replacement'])
-
-    # Add day of week to the date column
-    df_month['Date'] = pd.to_datetime(df_month['Date']).dt.strftime('%Y-%m-%d %A')
-
-    if days is None:
-        to_print = df_month
-    else:
-        end_idx = min(len(df_month), date_arg.day)
+    if days is not None:
+        end_idx = min(len(rows), date_arg.day)
         start_idx = max(0, end_idx - days)
-        to_print = df_month.iloc[start_idx:end_idx]
-
-    print(to_print.to_markdown(index=False, tablefmt=config['display']['table_format']))
+        rows = rows[start_idx:end_idx]
+
+    # Show the columns the file actually has
+    headers = list(rows[0]) if rows else list(COLUMNS)
+    table = []
+    for row in rows:
+        cells = {column: row.get(column) or nan_replacement for column in headers}
+        # Add day of week to the date column
+        cells['Date'] = f"{row['Date']} {date.fromisoformat(row['Date']).strftime('%A')}"
+        table.append(list(cells.values()))
+
+    print(tabulate(table, headers=headers, tablefmt=table_format))
+
+
+# Commands handled by fast_parse_args, mapped to the type and allowed values of their time argument.
+# A type of None means the command takes no time argument.
+# 'log' only has options of its own and always goes through the full parser.
+# Must be kept in sync with build_parser, which the tests check.
+FAST_COMMANDS: Dict[str, Tuple[Optional[type], Optional[Tuple[Any, ...]]]] = {
+    'start': (str, None),
+    'end': (str, None),
+    'break': (str, None),
+    'vacation': (float, (0.5, 1.0)),
+    'sick': (float, (0.5, 1.0)),
+    'show': (int, None),
+    'create': (None, None),
+}
+
+
+def fast_parse_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the common command lines by hand, since building the argparse parser is slow.
+    Everything unusual (help, unknown options, invalid values) is left to the full parser.
+    :param argv: Command-line arguments without the program name
+    :return: Parsed arguments, or None if argv has to go through parse_args
+    """
+    if not argv or argv[0] not in FAST_COMMANDS:
+        return None
+    command = argv[0]
+    arg_type, choices = FAST_COMMANDS[command]
+
+    options = {'date': None, 'config': DEFAULT_CONFIG_PATH}
+    positionals = []
+    rest = iter(argv[1:])
+    for arg in rest:
+        if not arg.startswith('-'):
+            positionals.append(arg)
+            continue
+        name, has_value, value = arg.removeprefix('--').partition('=')
+        if not arg.startswith('--') or name not in options:
+            return None
+        if not has_value:
+            value = next(rest, None)
+            if value is None or value.startswith('-'):
+                return None
+        options[name] = value
+
+    if arg_type is None:
+        return argparse.Namespace(command=command, **options) if not positionals else None
+
+    if len(positionals) != 1:
+        return None
+    try:
+        time = arg_type(positionals[0])
+    except ValueError:
+        return None
+    if choices is not None and time not in choices:
+        return None
+    return argparse.Namespace(command=command, time=time, **options)
 
 
-def parse_args() -> argparse.Namespace:
+def build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
-    :return: Parsed arguments
+    Build the full command-line parser with all subcommands.
+    :return: Argument parser
     """
     parser = argparse.ArgumentParser(
         description='Work time tracking program',
@@ -270,6 +501,12 @@ def parse_args() -> argparse.Namespace:
     break_parser = subparsers.add_parser('break', help='Log break time')
     break_parser.add_argument('time', help='Break time in minutes or HH:MM format')
 
+    # Combined log command
+    log_parser = subparsers.add_parser('log', help='Log start, end and break time at once')
+    log_parser.add_argument('--start', dest='start_time', metavar='TIME', help='Start time in HH:MM format')
+    log_parser.add_argument('--end', dest='end_time', metavar='TIME', help='End time in HH:MM format')
+    log_parser.add_argument('--break', dest='break_time', metavar='TIME', help='Break time in minutes or HH:MM format')
+
     # Vacation command
     vacation_parser = subparsers.add_parser('vacation', help='Log vacation')
     vacation_parser.add_argument('time', type=float, choices=[0.5, 1.0], help='Vacation time: 0.5 or 1.0 days')
@@ -286,13 +523,23 @@ def parse_args() -> argparse.Namespace:
     create_parser = subparsers.add_parser('create', help='Create a new schedule CSV file')
 
     # Common arguments for all subcommands
-    # Default config path relative to main.py location
-    repo_root = Path(__file__).parent.parent
-
     for sub in subparsers.choices.values():
         sub.add_argument('--date', help='Date in YYYY-MM-DD format (default: today)', default=None)
-        sub.add_argument('--config', help='Path to config file', default=repo_root / 'config.toml')
+        sub.add_argument('--config', help='Path to config file', default=DEFAULT_CONFIG_PATH)
+
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    :return: Parsed arguments
+    """
+    args = fast_parse_args(sys.argv[1:])
+    if args is not None:
+        return args
 
+    parser = build_parser()
     args = parser.parse_args()
 
     # If no command provided, show help
@@ -303,46 +550,56 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
-config = {}
-
-
 def main():
     """
     Main function to handle command-line arguments.
     """
 
     args = parse_args()
-    global config
-    config = load_config(args.config)
 
     # Parse date if provided, otherwise use today
     work_date = date.fromisoformat(args.date) if args.date else date.today()
-    arg_time = getattr(args, 'time', None)
-
-    # lambda to print the last N days (from config)
-    show_prev_days = lambda: show_csv(work_date,
-                                      days=config['general']['show_days_after_log'],
-                                      path=config['general']['data_path'],
-                                      )
-
-    # Execute the appropriate command
-    # Dict mapping commands to functions and strings for printing
-    command_map = {
-        'start': (log_start_time, f"Logged start time {arg_time} for {work_date}"),
-        'end': (log_end_time, f"Logged end time {arg_time} for {work_date}"),
-        'break': (log_break_time, f"Logged break time {arg_time} for {work_date}"),
-        'vacation': (log_vacation, f"Logged {arg_time} day vacation for {work_date}"),
-        'sick': (log_sick_leave, f"Logged {arg_time} day sick leave for {work_date}"),
-        'show': (show_csv, ''),
-        'create': (create_csv, f"Created schedule for {work_date.year}-{work_date.month:02d}"),
-    }
+    if args.command == 'log':
+        arg_time = {name: value for name, value in
+                    (('start', args.start_time), ('end', args.end_time), ('break', args.break_time))
+                    if value is not None}
+        logged_times = ', '.join(f'{name} time {value}' for name, value in arg_time.items())
+    else:
+        arg_time = getattr(args, 'time', None)
+        logged_times = ''
 
     try:
-        fun, msg = command_map[args.command]
-        fun(work_date, arg_time, path=config['general']['data_path'])
-        if args.command not in ['show', 'create']:
-            show_prev_days()
-        if msg:
+        config = get_config(args.config)
+        filename = get_filename(work_date, config['general']['data_path'])
+
+        # Execute the appropriate command
+        # Dict mapping logging commands to functions and strings for printing
+        log_map = {
+            'start': (log_start_time, f"Logged start time {arg_time} for {work_date}"),
+            'end': (log_end_time, f"Logged end time {arg_time} for {work_date}"),
+            'break': (log_break_time, f"Logged break time {arg_time} for {work_date}"),
+            'log': (log_times, f"Logged {logged_times} for {work_date}"),
+            'vacation': (log_vacation, f"Logged {arg_time} day vacation for {work_date}"),
+            'sick': (log_sick_leave, f"Logged {arg_time} day sick leave for {work_date}"),
+        }
+
+        # The [holidays] and [display] settings are only read by the commands that need them
+        if args.command == 'create':
+            create_csv(work_date, None, filename, **holiday_settings(config))
+            print(f"\nCreated schedule for {work_date.year}-{work_date.month:02d}")
+        elif args.command == 'show':
+            show_csv(work_date, arg_time, filename, **display_settings(config))
+        else:
+            fun, msg = log_map[args.command]
+            try:
+                rows = fun(work_date, arg_time, filename)
+            except FileNotFoundError:
+                # First entry of the month, create the file and log again
+                create_csv(work_date, None, filename, **holiday_settings(config))
+                rows = fun(work_date, arg_time, filename)
+            # Print the last N days (from config)
+            show_csv(work_date, config['general']['show_days_after_log'], filename, rows=rows,
+                     **display_settings(config))
             print(f"\n{msg}")
 
     except Exception as e:
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The program is a single script in src/, make it importable for the tests
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
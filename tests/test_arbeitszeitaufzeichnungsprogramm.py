@@ -0,0 +1,274 @@
+import argparse
+import csv
+from datetime import date
+
+import pytest
+
+import arbeitszeitaufzeichnungsprogramm as azap
+
+
+def subparser_choices(parser: argparse.ArgumentParser) -> dict:
+    """
+    Get the subparsers of parser by command name.
+    """
+    return next(action for action in parser._actions if isinstance(action, argparse._SubParsersAction)).choices
+
+
+@pytest.mark.parametrize('argv', [
+    ['start', '9:00'],
+    ['end', '17:30', '--date', '2024-05-03'],
+    ['break', '45', '--date=2024-05-03'],
+    ['break', '1:00', '--config', 'other.toml'],
+    ['break', '30', '--config=other.toml', '--date', '2024-05-03'],
+    ['vacation', '0.5'],
+    ['vacation', '1', '--date', '2024-05-03'],
+    ['sick', '1.0'],
+    ['show', '3'],
+    ['show', '7', '--date', '2024-05-03', '--config', 'other.toml'],
+    ['create'],
+    ['create', '--date', '2024-06-01'],
+    ['start', '--date', '2024-05-03', '9:00'],
+    ['start', '9:00', '--date', '2024-05-01', '--date', '2024-05-03'],
+])
+def test_fast_parse_args_matches_argparse(argv):
+    assert azap.fast_parse_args(argv) == azap.build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize('argv', [
+    [],
+    ['--help'],
+    ['start', '-h'],
+    ['start'],
+    ['start', '9:00', '10:00'],
+    ['start', '9:00', '--date'],
+    ['start', '9:00', '--date', '--config', 'other.toml'],
+    ['start', '9:00', '--unknown', 'x'],
+    ['start', '9:00', '--conf', 'other.toml'],
+    ['start', '--', '9:00'],
+    ['break', '-5'],
+    ['vacation', '2'],
+    ['sick', 'x'],
+    ['show', 'x'],
+    ['create', '1'],
+    ['log', '--start', '9:00'],
+    ['unknown'],
+])
+def test_fast_parse_args_leaves_rest_to_argparse(argv):
+    assert azap.fast_parse_args(argv) is None
+
+
+@pytest.mark.parametrize('command', azap.FAST_COMMANDS)
+def test_fast_commands_match_subparsers(command):
+    subparser = subparser_choices(azap.build_parser())[command]
+    actions = {action.dest: action for action in subparser._actions}
+    arg_type, choices = azap.FAST_COMMANDS[command]
+
+    if arg_type is None:
+        assert set(actions) == {'help', 'date', 'config'}
+    else:
+        assert set(actions) == {'help', 'time', 'date', 'config'}
+        assert (actions['time'].type or str) is arg_type
+        assert tuple(actions['time'].choices or ()) == (choices or ())
+    assert actions['date'].default is None
+    assert actions['config'].default == azap.DEFAULT_CONFIG_PATH
+
+
+def test_fast_commands_cover_subparsers():
+    # Only 'log' is deliberately left to argparse
+    assert set(subparser_choices(azap.build_parser())) - set(azap.FAST_COMMANDS) == {'log'}
+
+
+def write_month(filename, year: int, month: int, num_days: int):
+    """
+    Write an empty month file like create_csv does, without holidays.
+    """
+    lines = [','.join(azap.COLUMNS)]
+    lines += [f'{year:04d}-{month:02d}-{day:02d},False,,,,,,' for day in range(1, num_days + 1)]
+    filename.write_text('\n'.join(lines) + '\n')
+
+
+def read_month(filename) -> list:
+    with open(filename, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_log_command_writes_all_times(tmp_path, monkeypatch, capsys):
+    config_path = tmp_path / 'config.toml'
+    config_path.write_text('[general]\nshow_days_after_log = 2\ndata_path = "data"\n'
+                           '[display]\nnan_replacement = "-"\ntable_format = "presto"\n')
+    filename = tmp_path / 'data' / 'schedule_2024-05.csv'
+    filename.parent.mkdir()
+    write_month(filename, 2024, 5, 31)
+
+    monkeypatch.setattr(azap.sys, 'argv', ['azap', 'log', '--start', '8:00', '--end', '16:30', '--break', '45',
+                                           '--date', '2024-05-10', '--config', str(config_path)])
+    azap.main()
+
+    rows = read_month(filename)
+    assert len(rows) == 31
+    assert rows[9] == {'Date': '2024-05-10', 'Is Holiday': 'False', 'Start Time': '08:00', 'End Time': '16:30',
+                       'Break Time': '00:45', 'Vacation': '', 'Sick Leave': '', 'Notes': ''}
+    assert all(row['Start Time'] == '' for i, row in enumerate(rows) if i != 9)
+    assert 'Logged start time 8:00, end time 16:30, break time 45 for 2024-05-10' in capsys.readouterr().out
+
+
+def test_log_times_without_times_raises(tmp_path):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    write_month(filename, 2024, 5, 31)
+    content = filename.read_text()
+
+    with pytest.raises(ValueError, match='Nothing to log'):
+        azap.log_times(date(2024, 5, 10), {}, filename)
+    assert filename.read_text() == content
+
+
+def test_update_fields_missing_month_raises(tmp_path):
+    # main creates the month and retries, so update_fields must not create files itself
+    filename = tmp_path / 'schedule_2024-05.csv'
+
+    with pytest.raises(FileNotFoundError):
+        azap.update_fields(date(2024, 5, 10), {'Start Time': '09:00'}, filename)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_log_keeps_extra_columns(tmp_path, capsys):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    lines = [','.join(azap.COLUMNS + ('Project',))]
+    lines += [f'2024-05-{day:02d},False,,,,,,,P{day}' for day in range(1, 32)]
+    filename.write_text('\n'.join(lines) + '\n')
+
+    rows = azap.log_start_time(date(2024, 5, 10), '9:00', filename)
+    azap.show_csv(date(2024, 5, 10), 2, filename, nan_replacement='-', table_format='presto', rows=rows)
+
+    written = read_month(filename)
+    assert list(written[0]) == list(azap.COLUMNS) + ['Project']
+    assert written[9]['Start Time'] == '09:00'
+    assert [row['Project'] for row in written] == [f'P{day}' for day in range(1, 32)]
+    output = capsys.readouterr().out
+    assert 'Project' in output and 'P10' in output
+
+
+def test_log_adds_missing_column(tmp_path, capsys):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    filename.write_text('Date,Start Time\n' + ''.join(f'2024-05-{day:02d},\n' for day in range(1, 32)))
+
+    rows = azap.log_end_time(date(2024, 5, 10), '17:00', filename)
+    azap.show_csv(date(2024, 5, 10), 2, filename, nan_replacement='-', table_format='presto', rows=rows)
+
+    written = read_month(filename)
+    assert list(written[0]) == ['Date', 'Start Time', 'End Time']
+    assert written[9] == {'Date': '2024-05-10', 'Start Time': '', 'End Time': '17:00'}
+    assert '17:00' in capsys.readouterr().out
+
+
+def test_update_fields_finds_row_by_day(tmp_path):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    write_month(filename, 2024, 5, 31)
+
+    rows = azap.update_fields(date(2024, 5, 31), {'Start Time': '09:00'}, filename)
+
+    assert rows[30]['Date'] == '2024-05-31'
+    assert [row['Start Time'] for row in read_month(filename)] == [''] * 30 + ['09:00']
+
+
+def test_update_fields_short_file_raises(tmp_path):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    write_month(filename, 2024, 5, 5)
+    content = filename.read_text()
+
+    with pytest.raises(ValueError, match=r"Expected row for 2024-05-10 in '.*' but the file only has 5 rows"):
+        azap.update_fields(date(2024, 5, 10), {'Start Time': '09:00'}, filename)
+    assert filename.read_text() == content
+
+
+def test_update_fields_mismatched_date_raises(tmp_path):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    write_month(filename, 2024, 5, 31)
+    # Drop 2024-05-03, so every later day is one row off
+    lines = filename.read_text().splitlines(keepends=True)
+    filename.write_text(''.join(lines[:3] + lines[4:]))
+    content = filename.read_text()
+
+    with pytest.raises(ValueError, match=r"Expected row for 2024-05-10 in '.*' but found '2024-05-11'"):
+        azap.update_fields(date(2024, 5, 10), {'Start Time': '09:00'}, filename)
+    assert filename.read_text() == content
+
+
+def test_open_atomic_replaces_file(tmp_path):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    filename.write_text('old\n')
+
+    with azap.open_atomic(filename) as f:
+        f.write('new\n')
+
+    assert filename.read_text() == 'new\n'
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+def test_open_atomic_failed_write_leaves_file_untouched(tmp_path):
+    filename = tmp_path / 'schedule_2024-05.csv'
+    filename.write_text('old\n')
+
+    with pytest.raises(KeyboardInterrupt):
+        with azap.open_atomic(filename) as f:
+            f.write('partial')
+            raise KeyboardInterrupt
+
+    assert filename.read_text() == 'old\n'
+    # The temporary file is removed as well
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+def disable_hard_links(monkeypatch):
+    """
+    Make os.link fail like on file systems without hard links.
+    """
+    def no_link(*_):
+        raise PermissionError('Operation not permitted')
+    monkeypatch.setattr(azap.os, 'link', no_link)
+
+
+@pytest.mark.parametrize('hard_links', [True, False])
+def test_open_atomic_does_not_overwrite(tmp_path, monkeypatch, hard_links):
+    if not hard_links:
+        disable_hard_links(monkeypatch)
+    filename = tmp_path / 'schedule_2024-05.csv'
+    filename.write_text('old\n')
+
+    with pytest.raises(FileExistsError):
+        with azap.open_atomic(filename, overwrite=False) as f:
+            f.write('new\n')
+
+    assert filename.read_text() == 'old\n'
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+@pytest.mark.parametrize('hard_links', [True, False])
+def test_open_atomic_creates_new_file(tmp_path, monkeypatch, hard_links):
+    if not hard_links:
+        disable_hard_links(monkeypatch)
+    filename = tmp_path / 'schedule_2024-05.csv'
+
+    with azap.open_atomic(filename, overwrite=False) as f:
+        f.write('new\n')
+
+    assert filename.read_text() == 'new\n'
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+def test_create_csv_does_not_overwrite_month(tmp_path, monkeypatch):
+    monkeypatch.setattr(azap, 'get_holidays', lambda *_: {date(2024, 5, 1): 'Erster Mai'})
+    filename = tmp_path / 'schedule_2024-05.csv'
+
+    azap.create_csv(date(2024, 5, 1), None, filename, country='DE', subdiv='BY')
+    rows = read_month(filename)
+    assert len(rows) == 31
+    assert rows[0] == {'Date': '2024-05-01', 'Is Holiday': 'True', 'Start Time': '', 'End Time': '',
+                       'Break Time': '', 'Vacation': '', 'Sick Leave': '', 'Notes': 'Erster Mai'}
+
+    azap.update_fields(date(2024, 5, 10), {'Start Time': '09:00'}, filename)
+    content = filename.read_text()
+    with pytest.raises(FileExistsError, match='already exists'):
+        azap.create_csv(date(2024, 5, 1), None, filename, country='DE', subdiv='BY')
+    assert filename.read_text() == content
+    assert list(tmp_path.iterdir()) == [filename]